@@ -9,27 +9,91 @@ import sys
 import os
 import subprocess
 import argparse
+import calendar
+import hashlib
+import heapq
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
+from itertools import combinations
 from pathlib import Path
 import re
 
-# Install dependencies if needed
-try:
-    import feedparser
-    import requests
-except ImportError:
+REQUIRED_PACKAGES = ["feedparser", "requests"]
+
+
+def bootstrap(packages):
+    """Install missing dependencies with pip"""
     print("📦 Installing dependencies...", file=sys.stderr)
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "--break-system-packages", "feedparser", "requests"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "--break-system-packages", *packages])
     except subprocess.CalledProcessError:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "--user", "feedparser", "requests"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "--user", *packages])
+
+
+# Required packages are imported on first use (see _load_dependencies), so
+# importing this module never triggers pip or heavy imports
+feedparser = requests = HTTPAdapter = Retry = None
+
+
+def _load_dependencies():
+    """Import the required packages"""
+    global feedparser, requests, HTTPAdapter, Retry
+    if feedparser is not None:
+        return
+    
     import feedparser
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    # Only titles, links and plain-text keywords are used, so skip feedparser's
+    # costly HTML sanitizing and relative-URI resolution (tags are stripped below)
+    feedparser.RESOLVE_RELATIVE_URIS = False
+    feedparser.SANITIZE_HTML = False
+
+# Optional: faster curated-keyword matching
+try:
+    from flashtext import KeywordProcessor
+except ImportError:
+    KeywordProcessor = None
+
+# Optional: faster (compact) cache serialization
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+    _loads = json.loads
+
+
+USER_AGENT = "Mozilla/5.0 (compatible; ScoutBot/1.0; +https://mattgavin.dev)"
+
+# Common words ignored when extracting keywords
+_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
+    "be", "have", "has", "had", "do", "does", "did", "will", "would", "should",
+    "could", "may", "might", "can", "this", "that", "these", "those", "i", "you",
+    "he", "she", "it", "we", "they", "what", "which", "who", "when", "where",
+    "why", "how", "all", "each", "every", "both", "few", "more", "most", "other",
+    "some", "such", "no", "nor", "not", "only", "own", "same", "so", "than", "too",
+    "very", "just", "now", "new"
+})
+_WORD_RE = re.compile(r"\b[a-z]{3,}\b")
+_TAG_RE = re.compile(r"<[^>]+>")
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b[^>]*>.*?(?:</\1\s*>|$)", re.IGNORECASE | re.DOTALL)
+
+# Topic groups used to pick a suggestion angle
+_VOIP_TAGS = frozenset({"voip", "telecom", "vcon", "voice-intelligence"})
+_AI_TAGS = frozenset({"ai", "llm", "ai-agents"})
 
 
 class ContentMonitor:
-    def __init__(self, days=7, cache_hours=6, sources_file=None):
+    def __init__(self, days=7, cache_hours=1, sources_file=None):
+        _load_dependencies()
         self.days = days
         self.cache_hours = cache_hours
         self.base_dir = Path(__file__).parent
@@ -44,6 +108,16 @@ class ContentMonitor:
         self.topic_weights = self.config.get("topic_weights", {})
         self.feeds = self._collect_feeds()
         
+        # Resolve topic weights once; clusters refer to topics by integer id
+        self._topic_ids = {}
+        self._topic_names = []
+        self._weights = []
+        for topic in list(self.topic_weights) + [t for f in self.feeds for t in f["topics"]]:
+            self._topic_id(topic)
+        
+        self._match_vocabulary = self._load_vocabulary()
+        self.session = self._create_session()
+        
     def _collect_feeds(self):
         """Extract all sources with feed URLs"""
         feeds = []
@@ -58,32 +132,188 @@ class ContentMonitor:
                     })
         return feeds
     
+    def _topic_id(self, topic):
+        """Small integer id for a topic (assigned on first sight, e.g. from a stale cache)"""
+        if topic not in self._topic_ids:
+            self._topic_ids[topic] = len(self._weights)
+            self._topic_names.append(topic)
+            self._weights.append(self.topic_weights.get(topic, 0.3))
+        return self._topic_ids[topic]
+    
+    def _topic_mask(self, topics):
+        """Encode topics as a bitmask (bit i set = topic id i present)"""
+        mask = 0
+        for topic in topics:
+            mask |= 1 << self._topic_id(topic)
+        return mask
+    
+    def _load_vocabulary(self):
+        """Build a matcher for the curated keyword vocabulary (if configured)"""
+        keywords_file = self.config.get("keywords_file")
+        if not keywords_file:
+            self._tokenizer_id = self._fingerprint([_WORD_RE.pattern, *sorted(_STOPWORDS)])
+            return None
+        
+        with open(self.sources_file.parent / keywords_file) as f:
+            lines = [line.strip() for line in f]
+        terms = [line.lower() for line in lines if line and not line.startswith("#")]
+        terms += list(self.topic_weights)
+        
+        # Match hyphenated topics ("ai-agents") as written in prose too ("ai agents")
+        vocab = {}
+        for term in terms:
+            vocab[term] = term
+            vocab[term.replace("-", " ")] = term
+        self._tokenizer_id = self._fingerprint(sorted(f"{phrase}={term}" for phrase, term in vocab.items()))
+        
+        if KeywordProcessor is not None:
+            processor = KeywordProcessor(case_sensitive=False)
+            for phrase, term in vocab.items():
+                processor.add_keyword(phrase, term)
+            return processor.extract_keywords
+        
+        # Nothing to match (an empty alternation would match the empty string)
+        if not vocab:
+            return lambda text: []
+        
+        # Fallback: single alternation regex, longest phrases first; lookarounds rather
+        # than \b so terms ending in punctuation ("c++") match like flashtext does
+        pattern = re.compile(r"(?<!\w)(?:" + "|".join(re.escape(p) for p in sorted(vocab, key=len, reverse=True)) + r")(?!\w)")
+        return lambda text: [vocab[m] for m in pattern.findall(text.lower())]
+    
+    def _fingerprint(self, parts):
+        """Short stable hash identifying the tokenizer that produced cached keywords"""
+        return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:16]
+    
+    def _create_session(self):
+        """Shared HTTP session so feeds on the same host reuse connections"""
+        session = requests.Session()
+        session.headers.update({"User-Agent": USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
     def _load_cache(self):
-        """Load cached feed data"""
+        """Load cached feed data (freshness is checked per feed)"""
         if not self.cache_file.exists():
             return {}
         
         try:
-            with open(self.cache_file) as f:
-                cache = json.load(f)
-            
-            # Check if cache is still valid
-            cache_time = datetime.fromisoformat(cache.get("timestamp", "2000-01-01"))
-            if datetime.now() - cache_time < timedelta(hours=self.cache_hours):
-                return cache.get("feeds", {})
+            cache = _loads(self.cache_file.read_bytes())
+            return cache.get("feeds", {})
         except Exception as e:
             print(f"⚠️  Cache load failed: {e}", file=sys.stderr)
         
         return {}
     
+    def _covers(self, cached, cutoff):
+        """Check if cached entries were collected for a window reaching back to cutoff"""
+        return "cutoff" in cached and datetime.fromisoformat(cached["cutoff"]) <= cutoff
+    
+    def _is_fresh(self, cached, cutoff):
+        """Check if a cached feed is recent enough to skip the network entirely"""
+        fetched_at = cached.get("fetched_at")
+        if not fetched_at or not self._covers(cached, cutoff):
+            return False
+        return datetime.now() - datetime.fromisoformat(fetched_at) < timedelta(hours=self.cache_hours)
+    
     def _save_cache(self, feeds_data):
         """Save feed data to cache"""
         cache = {
             "timestamp": datetime.now().isoformat(),
             "feeds": feeds_data
         }
-        with open(self.cache_file, "w") as f:
-            json.dump(cache, f, indent=2)
+        self.cache_file.write_bytes(_dumps(cache))
+    
+    def _fetch_one(self, feed_info, cutoff, cached=None):
+        """Fetch and parse a single feed, returning (name, feed_data)"""
+        name = feed_info["name"]
+        url = feed_info["feed"]
+        cached = cached or {}
+        
+        # Conditional GET: let the server tell us if nothing changed, unless the
+        # cached entries don't reach back far enough for this run's window
+        headers = {}
+        if self._covers(cached, cutoff):
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        
+        print(f"🌐 Fetching: {name}", file=sys.stderr)
+        try:
+            with self.session.get(url, stream=True, timeout=(3.05, 10), headers=headers) as response:
+                response.raise_for_status()
+                
+                if response.status_code == 304:
+                    print(f"♻️  Not modified: {name}", file=sys.stderr)
+                    return name, {
+                        "entries": self._entries_since(cached["entries"], cutoff),
+                        "topics": feed_info["topics"],
+                        "category": feed_info["category"],
+                        "etag": cached.get("etag"),
+                        "last_modified": cached.get("last_modified"),
+                        "cutoff": cutoff.isoformat(),
+                        "tokenizer": cached.get("tokenizer"),
+                        "fetched_at": datetime.now().isoformat()
+                    }
+                
+                # Parse straight from the (decompressed) socket stream rather than buffering the body
+                response.raw.decode_content = True
+                feed = feedparser.parse(response.raw)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+            
+            # Malformed feed with nothing recoverable: report it instead of silently caching nothing
+            if feed.bozo and not feed.entries:
+                raise RuntimeError(feed.bozo_exception)
+            
+            entries = []
+            cutoff_ts = calendar.timegm(cutoff.timetuple())
+            for entry in feed.entries:
+                # Filter by publish date before building any datetime objects
+                parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+                if parsed and calendar.timegm(parsed) >= cutoff_ts:
+                    title = entry.get("title", "")
+                    # feedparser no longer sanitizes, so drop script/style bodies before the tags
+                    summary = _TAG_RE.sub(" ", _SCRIPT_STYLE_RE.sub(" ", entry.get("summary", "")))
+                    entries.append({
+                        "title": title,
+                        "link": entry.get("link", ""),
+                        "summary": summary,
+                        "published": datetime(*parsed[:6]).isoformat(),
+                        "keywords": self._extract_keywords(title + " " + summary)
+                    })
+            
+            return name, {
+                "entries": entries,
+                "topics": feed_info["topics"],
+                "category": feed_info["category"],
+                "etag": etag,
+                "last_modified": last_modified,
+                "cutoff": cutoff.isoformat(),
+                "tokenizer": self._tokenizer_id,
+                "fetched_at": datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            print(f"⚠️  Failed to fetch {name}: {e}", file=sys.stderr)
+            feed_data = {"entries": [], "topics": feed_info["topics"], "category": feed_info["category"]}
+            
+            # Keep what we had (minus fetched_at, so it's retried next run) rather than wiping it
+            if cached:
+                feed_data["entries"] = self._entries_since(cached.get("entries", []), cutoff)
+                feed_data["etag"] = cached.get("etag")
+                feed_data["last_modified"] = cached.get("last_modified")
+                feed_data["tokenizer"] = cached.get("tokenizer")
+                if "cutoff" in cached:
+                    feed_data["cutoff"] = max(datetime.fromisoformat(cached["cutoff"]), cutoff).isoformat()
+            return name, feed_data
+    
+    def _entries_since(self, entries, cutoff):
+        """Drop cached entries published before cutoff"""
+        return [e for e in entries if datetime.fromisoformat(e["published"]) >= cutoff]
     
     def fetch_feeds(self):
         """Fetch all RSS feeds (with caching)"""
@@ -91,50 +321,34 @@ class ContentMonitor:
         feeds_data = {}
         cutoff = datetime.now() - timedelta(days=self.days)
         
+        # Use cache where available, queue the rest for fetching
+        fetched = {}
+        to_fetch = [f for f in self.feeds if not self._is_fresh(cache.get(f["name"], {}), cutoff)]
+        
+        # Fetch feeds concurrently (network-bound, so threads overlap the waits)
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=min(16, len(to_fetch))) as pool:
+                futures = [pool.submit(self._fetch_one, feed_info, cutoff, cache.get(feed_info["name"])) for feed_info in to_fetch]
+                for future in as_completed(futures):
+                    name, feed_data = future.result()
+                    fetched[name] = feed_data
+        
+        # Assemble in config order so clustering stays deterministic
         for feed_info in self.feeds:
             name = feed_info["name"]
-            url = feed_info["feed"]
-            
-            # Use cache if available
-            if name in cache:
+            if name in fetched:
+                feeds_data[name] = fetched[name]
+            else:
                 print(f"📋 Using cached: {name}", file=sys.stderr)
-                feeds_data[name] = cache[name]
-                continue
-            
-            # Fetch feed
-            print(f"🌐 Fetching: {name}", file=sys.stderr)
-            try:
-                response = requests.get(url, timeout=10, headers={"User-Agent": "Mozilla/5.0 (compatible; ScoutBot/1.0; +https://mattgavin.dev)"})
-                response.raise_for_status()
-                feed = feedparser.parse(response.content)
-                
-                entries = []
-                for entry in feed.entries:
-                    # Parse publish date
-                    pub_date = None
-                    if hasattr(entry, "published_parsed") and entry.published_parsed:
-                        pub_date = datetime(*entry.published_parsed[:6])
-                    elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                        pub_date = datetime(*entry.updated_parsed[:6])
-                    
-                    # Filter by date
-                    if pub_date and pub_date >= cutoff:
-                        entries.append({
-                            "title": entry.get("title", ""),
-                            "link": entry.get("link", ""),
-                            "summary": entry.get("summary", ""),
-                            "published": pub_date.isoformat()
-                        })
-                
-                feeds_data[name] = {
-                    "entries": entries,
-                    "topics": feed_info["topics"],
-                    "category": feed_info["category"]
-                }
-                
-            except Exception as e:
-                print(f"⚠️  Failed to fetch {name}: {e}", file=sys.stderr)
-                feeds_data[name] = {"entries": [], "topics": feed_info["topics"], "category": feed_info["category"]}
+                # Fresh entries cover this window (see _is_fresh) but may reach further back
+                feeds_data[name] = dict(cache[name], entries=self._entries_since(cache[name]["entries"], cutoff), cutoff=cutoff.isoformat())
+        
+        # Re-tokenize cached entries whose keywords came from a different tokenizer or vocabulary
+        for feed_data in feeds_data.values():
+            if feed_data.get("tokenizer") != self._tokenizer_id:
+                for entry in feed_data["entries"]:
+                    entry["keywords"] = self._extract_keywords(entry["title"] + " " + entry["summary"])
+                feed_data["tokenizer"] = self._tokenizer_id
         
         # Save cache
         self._save_cache(feeds_data)
@@ -142,37 +356,44 @@ class ContentMonitor:
     
     def _extract_keywords(self, text):
         """Extract meaningful keywords from text"""
-        # Remove common words
-        stop_words = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-            "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
-            "be", "have", "has", "had", "do", "does", "did", "will", "would", "should",
-            "could", "may", "might", "can", "this", "that", "these", "those", "i", "you",
-            "he", "she", "it", "we", "they", "what", "which", "who", "when", "where",
-            "why", "how", "all", "each", "every", "both", "few", "more", "most", "other",
-            "some", "such", "no", "nor", "not", "only", "own", "same", "so", "than", "too",
-            "very", "just", "now", "new"
-        }
+        if self._match_vocabulary:
+            return self._match_vocabulary(text)
+        return [w for w in _WORD_RE.findall(text.lower()) if w not in _STOPWORDS]
+    
+    def _shared_keywords(self, keyword_sets):
+        """Count shared keywords for every pair of entries that has any"""
+        # Inverted index: only entries sharing a keyword can be similar
+        postings = defaultdict(list)
+        for i, kwset in enumerate(keyword_sets):
+            for kw in kwset:
+                postings[kw].append(i)
         
-        # Lowercase and extract words
-        words = re.findall(r'\b[a-z]{3,}\b', text.lower())
-        return [w for w in words if w not in stop_words]
+        intersections = Counter()
+        for ids in postings.values():
+            intersections.update(combinations(ids, 2))
+        return intersections
     
-    def _calculate_similarity(self, keywords1, keywords2):
-        """Calculate keyword overlap similarity (Jaccard index)"""
-        if not keywords1 or not keywords2:
-            return 0.0
-        set1, set2 = set(keywords1), set(keywords2)
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-        return intersection / union if union > 0 else 0.0
+    def _similar_pairs(self, keyword_sets, threshold=0.15):
+        """Find entry pairs whose keyword overlap (Jaccard index) exceeds threshold"""
+        sizes = [len(kwset) for kwset in keyword_sets]
+        intersections = self._shared_keywords(keyword_sets)
+        
+        pairs = []
+        for (i, j), inter in intersections.items():
+            union = sizes[i] + sizes[j] - inter
+            if inter / union > threshold:
+                pairs.append((i, j))
+        return pairs
     
     def cluster_topics(self, feeds_data):
         """Group entries by topic similarity"""
         all_entries = []
+        topic_masks = []
         
         # Collect all entries with metadata
         for feed_name, feed_data in feeds_data.items():
+            feed_mask = self._topic_mask(feed_data["topics"])
+            cached_keywords = feed_data.get("tokenizer") == self._tokenizer_id
             for entry in feed_data["entries"]:
                 all_entries.append({
                     "title": entry["title"],
@@ -181,51 +402,70 @@ class ContentMonitor:
                     "published": entry["published"],
                     "source": feed_name,
                     "source_topics": feed_data["topics"],
-                    "keywords": self._extract_keywords(entry["title"] + " " + entry["summary"])
+                    # Keywords are cached with the entry when produced by the current tokenizer
+                    "keywords": entry["keywords"] if cached_keywords and "keywords" in entry else self._extract_keywords(entry["title"] + " " + entry["summary"])
                 })
+                topic_masks.append(feed_mask)
         
-        # Cluster by similarity
-        clusters = []
-        used = set()
+        # Per-entry similarity data lives in parallel lists, off the entry dicts
+        # (which end up in JSON output); keywords are hashed once here
+        keyword_sets = [frozenset(entry["keywords"]) for entry in all_entries]
         
-        for i, entry in enumerate(all_entries):
-            if i in used:
+        # Merge similar entries transitively (A~B, B~C => one cluster)
+        parent = list(range(len(all_entries)))
+        rank = [0] * len(all_entries)
+        
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]  # Path halving
+                i = parent[i]
+            return i
+        
+        for i, j in self._similar_pairs(keyword_sets):  # 15% keyword overlap threshold
+            root_i, root_j = find(i), find(j)
+            if root_i == root_j:
                 continue
-            
-            cluster = {
-                "entries": [entry],
-                "keywords": Counter(entry["keywords"]),
-                "sources": {entry["source"]},
-                "topics": set(entry["source_topics"])
-            }
-            used.add(i)
-            
-            # Find similar entries
-            for j, other in enumerate(all_entries[i+1:], i+1):
-                if j in used:
-                    continue
-                
-                similarity = self._calculate_similarity(entry["keywords"], other["keywords"])
-                if similarity > 0.15:  # 15% keyword overlap threshold
-                    cluster["entries"].append(other)
-                    cluster["keywords"].update(other["keywords"])
-                    cluster["sources"].add(other["source"])
-                    cluster["topics"].update(other["source_topics"])
-                    used.add(j)
-            
-            clusters.append(cluster)
+            if rank[root_i] < rank[root_j]:
+                root_i, root_j = root_j, root_i
+            parent[root_j] = root_i
+            if rank[root_i] == rank[root_j]:
+                rank[root_i] += 1
+        
+        # Build clusters in a single pass, ordered by their first entry
+        clusters = {}
+        cluster_masks = defaultdict(int)
+        for i, entry in enumerate(all_entries):
+            root = find(i)
+            if root not in clusters:
+                clusters[root] = {
+                    "entries": [],
+                    "keywords": Counter(),
+                    "sources": set()
+                }
+            cluster = clusters[root]
+            cluster["entries"].append(entry)
+            cluster["keywords"].update(entry["keywords"])
+            cluster["sources"].add(entry["source"])
+            cluster_masks[root] |= topic_masks[i]
         
-        return clusters
+        # Decode each cluster's topic bitmask
+        for root, cluster in clusters.items():
+            mask = cluster_masks[root]
+            topic_ids = []
+            while mask:
+                low = mask & -mask
+                topic_ids.append(low.bit_length() - 1)
+                mask ^= low
+            cluster["topic_ids"] = topic_ids
+            cluster["topics"] = {self._topic_names[t] for t in topic_ids}
+        
+        return list(clusters.values())
     
     def score_cluster(self, cluster):
         """Calculate relevance score based on topic weights and coverage"""
-        # Base score from topic weights
-        topic_score = 0.0
-        for topic in cluster["topics"]:
-            topic_score += self.topic_weights.get(topic, 0.3)
-        
-        # Average topic score
-        topic_score = topic_score / len(cluster["topics"]) if cluster["topics"] else 0.3
+        # Average topic weight
+        topic_ids = cluster["topic_ids"]
+        topic_score = sum(self._weights[t] for t in topic_ids) / len(topic_ids) if topic_ids else 0.3
         
         # Boost for multiple sources covering the same topic
         source_multiplier = 1.0 + (len(cluster["sources"]) - 1) * 0.3
@@ -237,15 +477,18 @@ class ContentMonitor:
     
     def generate_suggestions(self, clusters):
         """Generate blog post suggestions from clusters"""
-        suggestions = []
+        # Score everything, but only build suggestions for the top 5
+        scored = [(self.score_cluster(cluster), cluster) for cluster in clusters]
+        top = heapq.nlargest(5, scored, key=lambda x: x[0])
         
-        for cluster in clusters:
+        suggestions = []
+        for score, cluster in top:
             # Get most common keywords for headline
             top_keywords = [kw for kw, _ in cluster["keywords"].most_common(5)]
             
             # Create suggestion
             suggestion = {
-                "score": self.score_cluster(cluster),
+                "score": score,
                 "headline": self._generate_headline(cluster, top_keywords),
                 "sources": sorted(cluster["sources"]),
                 "topics": sorted(cluster["topics"]),
@@ -255,9 +498,7 @@ class ContentMonitor:
             
             suggestions.append(suggestion)
         
-        # Sort by score and return top 5
-        suggestions.sort(key=lambda x: x["score"], reverse=True)
-        return suggestions[:5]
+        return suggestions
     
     def _generate_headline(self, cluster, keywords):
         """Generate a suggested headline"""
@@ -273,13 +514,13 @@ class ContentMonitor:
         topics = cluster["topics"]
         
         # VoIP/telecom angle
-        if any(t in topics for t in ["voip", "telecom", "vcon", "voice-intelligence"]):
+        if topics & _VOIP_TAGS:
             if "ai" in topics:
                 return "Connect this to vCon and AI-powered voice intelligence in telecom"
             return "How this impacts the VoIP/UCaaS industry and vCon adoption"
         
         # AI angle
-        if "ai" in topics or "llm" in topics or "ai-agents" in topics:
+        if topics & _AI_TAGS:
             if "dev-tools" in topics:
                 return "Developer perspective: practical applications and tooling"
             return "Bridge this AI development with telecom/voice applications"
@@ -324,8 +565,17 @@ def main():
     parser.add_argument("--days", type=int, default=7, help="Days to look back (default: 7)")
     parser.add_argument("--sources", type=str, default=None, help="Path to sources JSON (default: content-sources.json)")
     parser.add_argument("--json", action="store_true", help="Output JSON instead of human-readable")
+    parser.add_argument("--bootstrap", action="store_true", help="Install missing dependencies with pip before running")
     args = parser.parse_args()
     
+    # Check for dependencies without importing them; only install when asked to
+    missing = [name for name in REQUIRED_PACKAGES if importlib.util.find_spec(name) is None]
+    if missing:
+        if not args.bootstrap:
+            sys.exit(f"Missing dependencies: {' '.join(missing)} (run: pip install {' '.join(missing)}, or pass --bootstrap)")
+        bootstrap(missing)
+        importlib.invalidate_caches()
+    
     monitor = ContentMonitor(days=args.days, sources_file=args.sources)
     
     # Fetch feeds